@@ -1,28 +1,94 @@
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import os
 import asyncio
 from pathlib import Path
 import uuid
+import zlib
+
+from utils.async_loop import get_shared_loop
+from utils.solidity_etl import _iter_sol_files
+
+
+# Size of chunks read from disk while streaming multipart uploads
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Default timeout applied to every session request that doesn't set its own;
+# without one a hung backend stalls the caller indefinitely
+_DEFAULT_TIMEOUT = 60.0
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests lacking one."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = _DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+# Multipart field names probed for backend compatibility
+_VERSION_FIELD_NAMES = ("files", "contracts", "sources")
+
+# SSE framing constants for the chat stream parser
+_DATA_PREFIX = b"data: "
+_DATA_PREFIX_LEN = len(_DATA_PREFIX)
+_DONE = b"[DONE]"
+
+
+def _parse_response(response) -> Dict[str, Any]:
+    """Decode a JSON response body, falling back to status/text on failure.
+
+    Accepts both requests and httpx responses; parsing the raw content with
+    json.loads keeps one code path for either transport.
+    """
+    try:
+        return json.loads(response.content)
+    except ValueError:
+        return {"status_code": response.status_code, "text": response.text}
 
 
 class BevorApiClient:
     """Bevor API client wrapper.
 
     Initialize with an API key. Optionally set an existing project id or a contracts folder path.
+
+    The constructor performs no network or file I/O; call the async ``create()``
+    factory (or ``create_sync()`` outside an event loop) to run initialization.
     """
 
+    # Discovered endpoints keyed by base_url so repeat calls skip the probing loops.
+    # Class-level on purpose: every client instance against the same backend benefits.
+    _versions_endpoint_cache: Dict[str, Tuple[str, str]] = {}
+    _chats_endpoint_cache: Dict[str, str] = {}
+
     def __init__(self, bevor_api_key: str, project_id: Optional[str] = None, contracts_folder_path: Optional[str] = None) -> None:
         self.base_url = (os.getenv("BEVOR_API_URL") or "http://localhost:8000").rstrip("/")
         # Read API key from BEVOR_API_KEY (fallback to provided arg)
         self.bevor_api_key = os.getenv("BEVOR_API_KEY") or bevor_api_key
         self.session = requests.Session()
+        # Keep a few idle sockets warm so repeated endpoint probes reuse
+        # connections, and enforce a default timeout on every session call
+        _pool_adapter = _TimeoutHTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("http://", _pool_adapter)
+        self.session.mount("https://", _pool_adapter)
         self.session.headers.update({
             "Authorization": f"Bearer {self.bevor_api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         })
+        # Native async client for the non-streaming API calls; avoids the
+        # thread hop that asyncio.to_thread + requests would cost per request
+        self._aclient = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=dict(self.session.headers),
+            limits=httpx.Limits(max_keepalive_connections=8),
+            timeout=60.0,
+        )
+        # Pre-bound request method; skips two attribute lookups per call
+        self._arequest = self._aclient.request
         # Prefer explicit project_id, else environment override if provided
         self.project_id = project_id or os.getenv("BEVOR_PROJECT_ID")
         self.contracts_folder_path = contracts_folder_path
@@ -39,6 +105,14 @@ class BevorApiClient:
     ) -> "BevorApiClient":
         """Async factory that performs network/file I/O without blocking __init__."""
 
+        # The contracts walk is independent of project creation, so start it
+        # first and let it overlap with the project request
+        walk_task = None
+        if self.contracts_folder_path:
+            walk_task = asyncio.create_task(
+                asyncio.to_thread(self.pull_in_solidity_test_folder, self.contracts_folder_path)
+            )
+
         # Ensure project exists
         if not self.project_id:
             project_resp = await self._create_project()
@@ -49,9 +123,12 @@ class BevorApiClient:
                 or self.project_id
             )
 
-        if self.contracts_folder_path:
-            contracts_map = self.pull_in_solidity_test_folder(self.contracts_folder_path)
-            version_resp = self.versions_create_folder(contracts_map, self.project_id or "")
+        if walk_task is not None:
+            contracts_map = await walk_task
+            # Uploads run in a thread so the event loop stays responsive
+            version_resp = await asyncio.to_thread(
+                self.versions_create_folder, contracts_map, self.project_id or ""
+            )
             self.last_version_response = version_resp if isinstance(version_resp, dict) else {"_raw": str(version_resp)}
             # Robust extraction of a version/ mapping id from varied response shapes
             vr = version_resp or {}
@@ -64,7 +141,7 @@ class BevorApiClient:
                 or (vr.get("data", {}) or {}).get("id")
             )
             if self.version_mapping_id:
-                chat_resp = self.chat_with_version(self.version_mapping_id)
+                chat_resp = await asyncio.to_thread(self.chat_with_version, self.version_mapping_id)
                 self.last_chat_response = chat_resp if isinstance(chat_resp, dict) else {"_raw": str(chat_resp)}
                 if isinstance(chat_resp, dict):
                     self.chat_id = chat_resp.get("id") or chat_resp.get("chat_id")
@@ -75,8 +152,13 @@ class BevorApiClient:
     def create_sync(
         self,
     ) -> "BevorApiClient":
-        """Synchronous convenience wrapper for environments without an event loop."""
-        return asyncio.run(self.create())
+        """Synchronous convenience wrapper for environments without an event loop.
+
+        Runs on the process-wide loop thread rather than asyncio.run, so
+        repeated calls share one loop instead of building and tearing one down
+        each time.
+        """
+        return get_shared_loop().submit(self.create()).result()
 
 
     async def _request(
@@ -86,21 +168,21 @@ class BevorApiClient:
         *,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
-        stream: bool = False,
         timeout: Optional[float] = 60.0,
-    ) -> requests.Response:
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        # Use asyncio.to_thread to run synchronous requests in a separate thread
-        return await asyncio.to_thread(
-            self.session.request,
-            method=method.upper(),
-            url=url,
+    ) -> httpx.Response:
+        return await self._arequest(
+            method.upper(),
+            f"/{path.lstrip('/')}",
             params=params,
             json=json,
-            stream=stream,
             timeout=timeout,
         )
 
+    async def aclose(self) -> None:
+        """Release the underlying HTTP connections."""
+        await self._aclient.aclose()
+        self.session.close()
+
     
     async def _create_project(self, project_name: Optional[str] = None) -> Dict[str, Any]:
         """Create a new project with the given name or auto-generated name if none provided."""
@@ -117,48 +199,107 @@ class BevorApiClient:
             path="/projects",
             json=payload
         )
-        try:
-            return response.json()
-        except ValueError:
-            return {"status_code": response.status_code, "text": response.text}
+        return _parse_response(response)
 
 
-    def pull_in_solidity_test_folder(self, folder_path: str = "contracts") -> Dict[str, bytes]:
-        """Recursively read all .sol files under a folder; return mapping of relative_path -> bytes.
+    def pull_in_solidity_test_folder(self, folder_path: str = "contracts") -> Dict[str, Path]:
+        """Recursively find all .sol files under a folder; return mapping of relative_path -> Path.
 
         Only Solidity sources are included. Nested directories are supported.
         Paths are recorded relative to the provided folder to preserve structure.
+        Files are not read into memory here; uploads stream them from disk.
+        Only vendored directories (.git, node_modules) are skipped; test and
+        build-output sources under the folder are uploaded like any other.
         """
-        contracts_dict: Dict[str, bytes] = {}
+        contracts_dict: Dict[str, Path] = {}
         folder = Path(folder_path)
-        if not folder.exists() or not folder.is_dir():
+        # Single isdir stat; the old exists()+is_dir() pair statted twice
+        if not os.path.isdir(folder):
             return contracts_dict
-        for file_path in folder.rglob("*.sol"):
-            if file_path.is_file():
-                rel_path = str(file_path.relative_to(folder))
-                with open(file_path, 'rb') as f:
-                    contracts_dict[rel_path] = f.read()
+        for rel_path, file_path in _iter_sol_files(folder):
+            contracts_dict[rel_path] = file_path
         return contracts_dict
 
+    @staticmethod
+    def _iter_multipart(boundary: str, data: Dict[str, str], field_name: str, file_map: Dict[str, Path | bytes]):
+        """Yield a multipart/form-data body in bounded chunks.
 
-    def versions_create_folder(self, file_map: Dict[str, bytes], project_id: str) -> Dict[str, Any]:
+        Generating the body lazily keeps memory flat regardless of bundle size
+        and lets requests send with chunked transfer encoding, overlapping disk
+        reads with the socket write. Path values are read in _UPLOAD_CHUNK_SIZE
+        pieces; bytes values are emitted as-is.
+        """
+        delimiter = f"--{boundary}\r\n".encode()
+        for name, value in data.items():
+            yield delimiter
+            yield f'Content-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        for relative_path, source in file_map.items():
+            yield delimiter
+            yield (
+                f'Content-Disposition: form-data; name="{field_name}"; filename="{relative_path}"\r\n'
+                "Content-Type: application/octet-stream\r\n\r\n"
+            ).encode()
+            if isinstance(source, Path):
+                with open(source, "rb") as handle:
+                    while chunk := handle.read(_UPLOAD_CHUNK_SIZE):
+                        yield chunk
+            else:
+                yield source
+            yield b"\r\n"
+        yield f"--{boundary}--\r\n".encode()
+
+    @staticmethod
+    def _gzip_stream(chunks):
+        """Compress a byte-chunk stream with gzip on the fly.
+
+        Solidity source is highly compressible text, so this typically shrinks
+        the upload severalfold without ever materializing the body.
+        """
+        compressor = zlib.compressobj(wbits=31)  # wbits=31 -> gzip container
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+    def versions_create_folder(self, file_map: Dict[str, Path | bytes], project_id: str) -> Dict[str, Any]:
         """Create a new contract scan/version by sending contracts as multipart/form-data.
 
-        Tries multiple endpoint variants to accommodate backend differences.
+        Tries multiple endpoint variants to accommodate backend differences. The first
+        working (path, field_name) pair is cached per base_url so subsequent uploads
+        skip the probing loop entirely.
         """
-        # For multipart, don't set Content-Type; requests sets boundary automatically
-        headers = {
-            "Authorization": self.session.headers.get("Authorization", ""),
-            "Accept": "application/json",
-        }
         data = {"project_id": project_id, "projectId": project_id}
 
-        # Build alternative files payloads with different field names
-        files_variants = [
-            [("files", (relative_path, content, "application/octet-stream")) for relative_path, content in file_map.items()],
-            [("contracts", (relative_path, content, "application/octet-stream")) for relative_path, content in file_map.items()],
-            [("sources", (relative_path, content, "application/octet-stream")) for relative_path, content in file_map.items()],
-        ]
+        def _post_files(url: str, field_name: str, compress: bool = True) -> requests.Response:
+            # A fresh generator per attempt; a consumed body cannot be re-sent
+            boundary = uuid.uuid4().hex
+            body = self._iter_multipart(boundary, data, field_name, file_map)
+            headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+            if compress:
+                body = self._gzip_stream(body)
+                headers["Content-Encoding"] = "gzip"
+            resp = self.session.post(url, headers=headers, data=body)
+            # Many frameworks don't transparently decode request
+            # Content-Encoding and reject the compressed multipart with
+            # 400/415/422 rather than only 415, so retry raw on any failure
+            # except 404 (wrong endpoint, which the probing loop handles)
+            if compress and not resp.ok and resp.status_code != 404:
+                return _post_files(url, field_name, compress=False)
+            return resp
+
+        cached = self._versions_endpoint_cache.get(self.base_url)
+        if cached:
+            cached_path, cached_field = cached
+            try:
+                resp = _post_files(f"{self.base_url}{cached_path}", cached_field)
+            except requests.RequestException as e:
+                return {"error": str(e)}
+            if resp.status_code != 404:
+                return _parse_response(resp)
+            # Cached endpoint no longer exists; drop it and fall back to probing
+            self._versions_endpoint_cache.pop(self.base_url, None)
 
         candidate_paths = [
             "/versions/create/folder",
@@ -170,40 +311,51 @@ class BevorApiClient:
         last_resp: Optional[requests.Response] = None
         for path in candidate_paths:
             url = f"{self.base_url}{path}"
-            for files in files_variants:
+            # Cheap OPTIONS probe first so we never upload the whole bundle to a 404
+            try:
+                probe = self.session.options(url)
+            except requests.RequestException as e:
+                return {"error": str(e)}
+            if probe.status_code == 404:
+                continue
+            for field_name in _VERSION_FIELD_NAMES:
                 try:
-                    resp = requests.post(url, headers=headers, data=data, files=files)
+                    resp = _post_files(url, field_name)
                 except requests.RequestException as e:
                     return {"error": str(e)}
                 last_resp = resp
                 # Accept 200-299, and also 201/202 etc; skip 404s to try next variant
                 if resp.status_code >= 200 and resp.status_code < 300 and resp.status_code != 204:
-                    try:
-                        return resp.json()
-                    except ValueError:
-                        return {"status_code": resp.status_code, "text": resp.text}
+                    self._versions_endpoint_cache[self.base_url] = (path, field_name)
+                    return _parse_response(resp)
                 if resp.status_code == 404:
                     continue
                 # For other statuses, return the response as-is
-                try:
-                    return resp.json()
-                except ValueError:
-                    return {"status_code": resp.status_code, "text": resp.text}
+                return _parse_response(resp)
 
         if last_resp is not None:
-            try:
-                return last_resp.json()
-            except ValueError:
-                return {"status_code": last_resp.status_code, "text": last_resp.text}
+            return _parse_response(last_resp)
         return {"error": "No response from versions endpoint"}
 
 
     def chat_with_version(self, version_mapping_id: str) -> Dict[str, Any]:
         """Create a chat session for a given version mapping id.
 
-        Tries multiple endpoints to handle backend variations.
+        Tries multiple endpoints to handle backend variations; the first working
+        path is cached per base_url so later calls go straight to it.
         """
         payload = {"version_mapping_id": version_mapping_id, "versionMappingId": version_mapping_id}
+
+        cached_path = self._chats_endpoint_cache.get(self.base_url)
+        if cached_path:
+            try:
+                response = self.session.post(f"{self.base_url}{cached_path}", json=payload)
+            except requests.RequestException as e:
+                return {"error": str(e)}
+            if response.status_code != 404:
+                return _parse_response(response)
+            self._chats_endpoint_cache.pop(self.base_url, None)
+
         candidate_paths = [
             "/chats",
             "/chats/create",
@@ -218,21 +370,15 @@ class BevorApiClient:
                 return {"error": str(e)}
             last_resp = response
             if response.status_code >= 200 and response.status_code < 300 and response.status_code != 204:
-                try:
-                    return response.json()
-                except ValueError:
-                    return {"status_code": response.status_code, "text": response.text}
+                # Only cache static paths; the per-version path embeds the id
+                if version_mapping_id not in path:
+                    self._chats_endpoint_cache[self.base_url] = path
+                return _parse_response(response)
             if response.status_code == 404:
                 continue
-            try:
-                return response.json()
-            except ValueError:
-                return {"status_code": response.status_code, "text": response.text}
+            return _parse_response(response)
         if last_resp is not None:
-            try:
-                return last_resp.json()
-            except ValueError:
-                return {"status_code": last_resp.status_code, "text": last_resp.text}
+            return _parse_response(last_resp)
         return {"error": "No response from chats endpoint"}
 
     
@@ -243,17 +389,11 @@ class BevorApiClient:
         The endpoint streams Server-Sent Events; we return only the final message.
         """
         url = f"{self.base_url}/chats/{self.chat_id}"
-        # Use session headers which already include Authorization and JSON defaults
-        headers = {
-            "Authorization": self.session.headers.get("Authorization", ""),
-            "Content-Type": "application/json", 
-            "Accept": "application/json",
-        }
-
+        # Session headers already include Authorization and JSON defaults
         payload = {"message": message}
 
         try:
-            response = requests.post(url, headers=headers, json=payload, stream=True)
+            response = self.session.post(url, json=payload, stream=True)
         except requests.RequestException as e:
             return f"Error: {str(e)}"
 
@@ -269,87 +409,93 @@ class BevorApiClient:
         # Many backends stream cumulative snapshots. To avoid duplicated text,
         # we treat certain chunk types (event_type=text, content fields) as
         # full snapshots and overwrite the current buffer.
-        full_response = ""
+        # Accumulate in a list and join once at the end; growing a str
+        # chunk-by-chunk is O(n^2) for long responses.
+        parts: list[str] = []
+
+        def _apply_chunk(chunk_data: Any) -> None:
+            if isinstance(chunk_data, dict):
+                if chunk_data.get("event_type") == "text" and isinstance(chunk_data.get("content"), str):
+                    # Treat as full snapshot; overwrite to avoid duplication
+                    parts[:] = (chunk_data.get("content", ""),)
+                    return
+                delta = chunk_data.get("delta")
+                if isinstance(delta, str):
+                    parts.append(delta)
+                    return
+                content = (
+                    chunk_data.get("content")
+                    or chunk_data.get("text")
+                    or chunk_data.get("message")
+                    or chunk_data.get("response")
+                )
+                if isinstance(content, str):
+                    # Ambiguous snapshot-or-delta chunk: collapse the buffer
+                    # once to compare (rare relative to delta chunks)
+                    current = "".join(parts)
+                    # If new content is a superset of current, overwrite
+                    if content.startswith(current):
+                        parts[:] = (content,)
+                    # If current is a superset, keep current; else append conservatively
+                    elif current.startswith(content):
+                        pass
+                    else:
+                        parts[:] = ((current + " " + content).strip(),)
+                # Avoid echoing raw dicts; ignore silently
+            else:
+                # Non-dict JSON (array/string/number) -> append stringified
+                parts.append(str(chunk_data))
+
+        def _handle_line(line: bytes) -> bool:
+            """Process one stream line; returns False once the stream is done.
+
+            Stays in bytes: the prefix check and JSON parse work on raw lines,
+            so only unparseable payloads ever get decoded.
+            """
+            # Case 1: SSE-style 'data: ' lines
+            if line.startswith(_DATA_PREFIX):
+                payload = line[_DATA_PREFIX_LEN:]
+                if payload.strip() == _DONE:
+                    return False
+                try:
+                    _apply_chunk(json.loads(payload))
+                except ValueError:
+                    parts.append(payload.decode("utf-8", errors="ignore"))
+                return True
+
+            # Case 2: Plain JSON line streaming (no 'data: ' prefix)
+            try:
+                _apply_chunk(json.loads(line))
+            except ValueError:
+                # Case 3: Plain text line
+                parts.append(line.decode("utf-8", errors="ignore"))
+            return True
+
         try:
-            for line in response.iter_lines():
-                if not line:
+            # Read fixed-size chunks and split lines ourselves; cheaper than
+            # iter_lines' internal buffer re-scanning for token streams
+            buffer = bytearray()
+            done = False
+            for chunk in response.iter_content(chunk_size=65536):
+                if not chunk:
                     continue
-                line_text = line.decode("utf-8", errors="ignore")
-
-                # Case 1: SSE-style 'data: ' lines
-                if line_text.startswith("data: "):
-                    data_content = line_text[6:]
-                    if data_content.strip() == "[DONE]":
+                buffer += chunk
+                while (newline := buffer.find(b"\n")) != -1:
+                    line = bytes(buffer[:newline]).rstrip(b"\r")
+                    del buffer[:newline + 1]
+                    if line and not _handle_line(line):
+                        done = True
                         break
-                    try:
-                        chunk_data = json.loads(data_content)
-                        if isinstance(chunk_data, dict):
-                            if chunk_data.get("event_type") == "text" and isinstance(chunk_data.get("content"), str):
-                                # Treat as full snapshot; overwrite to avoid duplication
-                                full_response = chunk_data.get("content", "")
-                                continue
-                            delta = chunk_data.get("delta")
-                            if isinstance(delta, str):
-                                full_response += delta
-                                continue
-                            content = (
-                                chunk_data.get("content")
-                                or chunk_data.get("text")
-                                or chunk_data.get("message")
-                                or chunk_data.get("response")
-                            )
-                            if isinstance(content, str):
-                                # If new content is a superset of current, overwrite
-                                if content.startswith(full_response):
-                                    full_response = content
-                                # If current is a superset, keep current; else append conservatively
-                                elif full_response.startswith(content):
-                                    pass
-                                else:
-                                    full_response = (full_response + " " + content).strip()
-                        else:
-                            full_response += str(chunk_data)
-                    except json.JSONDecodeError:
-                        full_response += data_content
-                    continue
-
-                # Case 2: Plain JSON line streaming (no 'data: ' prefix)
-                try:
-                    chunk_data = json.loads(line_text)
-                    if isinstance(chunk_data, dict):
-                        if chunk_data.get("event_type") == "text" and isinstance(chunk_data.get("content"), str):
-                            # Treat as full snapshot; overwrite to avoid duplication
-                            full_response = chunk_data.get("content", "")
-                            continue
-                        delta = chunk_data.get("delta")
-                        if isinstance(delta, str):
-                            full_response += delta
-                            continue
-                        content = (
-                            chunk_data.get("content")
-                            or chunk_data.get("text")
-                            or chunk_data.get("message")
-                            or chunk_data.get("response")
-                        )
-                        if isinstance(content, str):
-                            if content.startswith(full_response):
-                                full_response = content
-                            elif full_response.startswith(content):
-                                pass
-                            else:
-                                full_response = (full_response + " " + content).strip()
-                        else:
-                            # Avoid echoing raw dicts; ignore silently
-                            pass
-                    else:
-                        # Non-dict JSON (array/string/number) -> append stringified
-                        full_response += str(chunk_data)
-                except json.JSONDecodeError:
-                    # Case 3: Plain text line
-                    full_response += line_text
+                if done:
+                    break
+            if not done and buffer:
+                trailing = bytes(buffer).rstrip(b"\r")
+                if trailing:
+                    _handle_line(trailing)
         except Exception as e:
             return f"Error processing stream: {str(e)}"
 
+        full_response = "".join(parts)
         if full_response.strip():
             return full_response.strip()
 
@@ -0,0 +1,21 @@
+import os
+
+
+def snapshot_dir(project_dir: str) -> tuple[frozenset, frozenset]:
+    """List a project root (and node_modules/.bin when present) once.
+
+    Returns (root_names, bin_names) frozensets for membership-based
+    applicability checks; adapters and the service share this so detection
+    costs one or two directory listings instead of a stat per config file.
+    """
+    try:
+        root_names = frozenset(os.listdir(project_dir))
+    except OSError:
+        return frozenset(), frozenset()
+    bin_names: frozenset = frozenset()
+    if "node_modules" in root_names:
+        try:
+            bin_names = frozenset(os.listdir(os.path.join(project_dir, "node_modules", ".bin")))
+        except OSError:
+            pass
+    return root_names, bin_names
@@ -1,20 +1,29 @@
-from pathlib import Path
-from shutil import which
+import sys
 from typing import Sequence
 
+from ._probe import snapshot_dir
+
 
 class FoundryAdapter:
-    name = "foundry"
+    # Interned so name lookups and comparisons hit pointer equality first
+    name = sys.intern("foundry")
+    # Only detect Foundry if foundry.toml exists; there is no npm binary
+    CONFIG_FILES = frozenset({"foundry.toml"})
+    # Command constants; the service treats these as immutable
+    _BUILD = ("forge", "build")
+    _TEST = ("forge", "test")
+    BIN_NAME = None
 
     def is_applicable(self, project_dir: str) -> bool:
-        root = Path(project_dir)
-        # Only detect Foundry if foundry.toml exists
-        return (root / "foundry.toml").exists()
+        return self.is_applicable_fast(*snapshot_dir(project_dir))
+
+    def is_applicable_fast(self, root_names: frozenset, bin_names: frozenset) -> bool:
+        return not self.CONFIG_FILES.isdisjoint(root_names)
 
     def build_command(self, project_dir: str) -> Sequence[str]:
-        return ["forge", "build"]
+        return self._BUILD
 
     def test_command(self, project_dir: str) -> Sequence[str]:
-        return ["forge", "test"]
+        return self._TEST
 
 
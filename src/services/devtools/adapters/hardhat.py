@@ -1,20 +1,28 @@
-from pathlib import Path
+import sys
 from typing import Sequence
 
+from ._probe import snapshot_dir
+
 
 class HardhatAdapter:
-    name = "hardhat"
+    # Interned so name lookups and comparisons hit pointer equality first
+    name = sys.intern("hardhat")
+    CONFIG_FILES = frozenset({"hardhat.config.js", "hardhat.config.ts"})
+    # Command constants; the service treats these as immutable
+    _BUILD = ("npx", "hardhat", "compile")
+    _TEST = ("npx", "hardhat", "test")
+    BIN_NAME = "hardhat"
 
     def is_applicable(self, project_dir: str) -> bool:
-        root = Path(project_dir)
-        if (root / "hardhat.config.js").exists() or (root / "hardhat.config.ts").exists():
-            return True
-        return (root / "node_modules" / ".bin" / "hardhat").exists()
+        return self.is_applicable_fast(*snapshot_dir(project_dir))
+
+    def is_applicable_fast(self, root_names: frozenset, bin_names: frozenset) -> bool:
+        return not self.CONFIG_FILES.isdisjoint(root_names) or self.BIN_NAME in bin_names
 
     def build_command(self, project_dir: str) -> Sequence[str]:
-        return ["npx", "hardhat", "compile"]
+        return self._BUILD
 
     def test_command(self, project_dir: str) -> Sequence[str]:
-        return ["npx", "hardhat", "test"]
+        return self._TEST
 
 
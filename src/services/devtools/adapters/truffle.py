@@ -1,20 +1,28 @@
-from pathlib import Path
+import sys
 from typing import Sequence
 
+from ._probe import snapshot_dir
+
 
 class TruffleAdapter:
-    name = "truffle"
+    # Interned so name lookups and comparisons hit pointer equality first
+    name = sys.intern("truffle")
+    CONFIG_FILES = frozenset({"truffle-config.js", "truffle.js"})
+    # Command constants; the service treats these as immutable
+    _BUILD = ("npx", "truffle", "build")
+    _TEST = ("npx", "truffle", "test")
+    BIN_NAME = "truffle"
 
     def is_applicable(self, project_dir: str) -> bool:
-        root = Path(project_dir)
-        if (root / "truffle-config.js").exists() or (root / "truffle.js").exists():
-            return True
-        return (root / "node_modules" / ".bin" / "truffle").exists()
+        return self.is_applicable_fast(*snapshot_dir(project_dir))
+
+    def is_applicable_fast(self, root_names: frozenset, bin_names: frozenset) -> bool:
+        return not self.CONFIG_FILES.isdisjoint(root_names) or self.BIN_NAME in bin_names
 
     def build_command(self, project_dir: str) -> Sequence[str]:
-        return ["npx", "truffle", "build"]
+        return self._BUILD
 
     def test_command(self, project_dir: str) -> Sequence[str]:
-        return ["npx", "truffle", "test"]
+        return self._TEST
 
 
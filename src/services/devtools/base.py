@@ -8,7 +8,7 @@ class CommandResult:
     code: int
     stdout: str
     stderr: str
-    command: Sequence[str]
+    command: tuple[str, ...]
 
 
 class DevToolAdapter(Protocol):
@@ -17,6 +17,16 @@ class DevToolAdapter(Protocol):
     def is_applicable(self, project_dir: str) -> bool:
         ...
 
+    def is_applicable_fast(self, root_names: frozenset, bin_names: frozenset) -> bool:
+        """Membership-only applicability check against pre-listed directory names.
+
+        root_names holds the project root's entries and bin_names those of
+        node_modules/.bin, so detection across all adapters costs one or two
+        directory listings instead of a stat per probed file. Optional:
+        adapters without it fall back to is_applicable.
+        """
+        ...
+
     def build_command(self, project_dir: str) -> Sequence[str]:
         ...
 
@@ -1,7 +1,17 @@
+import asyncio
 import os
 import subprocess
 from typing import Sequence, Mapping, Optional, Tuple
 
+# Snapshot of the process environment taken once at import; spawning copies
+# the mapping anyway, so per-call {**os.environ} merges only paid for an
+# extra dict build. Calls without overrides reuse the snapshot directly.
+_BASE_ENV = dict(os.environ)
+
+
+def _build_env(env: Optional[Mapping[str, str]]) -> Mapping[str, str]:
+    return _BASE_ENV if not env else {**_BASE_ENV, **env}
+
 
 def run_command(
     command: Sequence[str],
@@ -13,20 +23,84 @@ def run_command(
 
     Timeout defaults to 15 minutes to accommodate compilation and tests.
     """
-    proc = subprocess.Popen(
-        command,
+    try:
+        completed = subprocess.run(
+            command,
+            cwd=cwd,
+            env=_build_env(env),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as exc:
+        # TimeoutExpired may carry undecoded bytes regardless of text mode
+        out = exc.stdout or ""
+        err = exc.stderr or ""
+        if isinstance(out, bytes):
+            out = out.decode("utf-8", "replace")
+        if isinstance(err, bytes):
+            err = err.decode("utf-8", "replace")
+        return 124, out, f"Timeout after {timeout}s\n{err}"
+    return completed.returncode, completed.stdout, completed.stderr
+
+
+# Per-stream cap for captured subprocess output; verbose test runs can emit
+# tens of megabytes which nobody wants echoed through an MCP response anyway
+_OUTPUT_LIMIT = 8 * 1024 * 1024
+
+
+async def _drain_stream(stream: asyncio.StreamReader, buf: bytearray, limit: int) -> None:
+    """Read a subprocess stream incrementally into buf, truncating at limit."""
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return
+        if len(buf) < limit:
+            buf += chunk[: limit - len(buf)]
+
+
+async def run_command_async(
+    command: Sequence[str],
+    cwd: Optional[str] = None,
+    env: Optional[Mapping[str, str]] = None,
+    timeout: Optional[int] = 900,
+) -> Tuple[int, str, str]:
+    """Async variant of run_command built on asyncio subprocesses.
+
+    Keeps the event loop responsive while long compilations or test runs
+    execute, and drains stdout/stderr incrementally with a size cap so memory
+    stays bounded regardless of command verbosity. Partial output is still
+    returned on timeout.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *command,
         cwd=cwd,
-        env={**os.environ, **(env or {})},
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+        env=_build_env(env),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out_buf = bytearray()
+    err_buf = bytearray()
+    drains = (
+        asyncio.create_task(_drain_stream(proc.stdout, out_buf, _OUTPUT_LIMIT)),
+        asyncio.create_task(_drain_stream(proc.stderr, err_buf, _OUTPUT_LIMIT)),
     )
     try:
-        out, err = proc.communicate(timeout=timeout)
-    except subprocess.TimeoutExpired:
+        await asyncio.wait_for(proc.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
         proc.kill()
-        out, err = proc.communicate()
-        return 124, out, f"Timeout after {timeout}s\n{err}"
-    return proc.returncode, out, err
+        await proc.wait()
+        await asyncio.gather(*drains, return_exceptions=True)
+        return (
+            124,
+            bytes(out_buf).decode("utf-8", "replace"),
+            f"Timeout after {timeout}s\n{bytes(err_buf).decode('utf-8', 'replace')}",
+        )
+    await asyncio.gather(*drains)
+    return (
+        proc.returncode,
+        bytes(out_buf).decode("utf-8", "replace"),
+        bytes(err_buf).decode("utf-8", "replace"),
+    )
 
 
@@ -1,42 +1,97 @@
+import os
 from typing import Optional, Mapping, Sequence
 
 from .base import DevToolAdapter, CommandResult
-from .runner import run_command
+from .runner import run_command, run_command_async
 from .adapters import FoundryAdapter, HardhatAdapter, TruffleAdapter
+from .adapters._probe import snapshot_dir
 
 
-DEFAULT_ADAPTERS: list[DevToolAdapter] = [
+DEFAULT_ADAPTERS: tuple[DevToolAdapter, ...] = (
     FoundryAdapter(),
     HardhatAdapter(),
     TruffleAdapter(),
-]
+)
 
 
 class DevToolsService:
-    def __init__(self, adapters: Optional[list[DevToolAdapter]] = None):
+    def __init__(self, adapters: Optional[Sequence[DevToolAdapter]] = None):
         self.adapters = adapters or DEFAULT_ADAPTERS
+        # Case-insensitive name lookup for explicit tool selection
+        self._by_name: dict[str, DevToolAdapter] = {a.name.lower(): a for a in self.adapters}
+        # Detection results keyed by project_dir; the stored mtime invalidates
+        # an entry once the directory contents change
+        self._detect_cache: dict[str, tuple[int, DevToolAdapter]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop memoized detection results; useful in tests that reuse a service."""
+        self._detect_cache.clear()
+
+    @staticmethod
+    def _snapshot_root(project_dir: str) -> tuple[frozenset, frozenset]:
+        """One-shot directory listing shared by the fast applicability checks."""
+        return snapshot_dir(project_dir)
 
     def detect(self, project_dir: str) -> DevToolAdapter:
-        candidates: list[DevToolAdapter] = [
-            a for a in self.adapters if a.is_applicable(project_dir)
-        ]
-        if not candidates:
-            raise RuntimeError("No supported dev tool detected in project directory")
-        # Deterministic precedence: Foundry > Hardhat > Truffle (based on DEFAULT_ADAPTERS)
-        return candidates[0]
+        try:
+            mtime_ns = os.stat(project_dir).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None:
+            cached = self._detect_cache.get(project_dir)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+        # Specialize the overwhelmingly common outcome: when Foundry holds top
+        # precedence, a single isfile on foundry.toml settles detection without
+        # listing the directory. Guarded so custom adapter orderings that rank
+        # something above Foundry never get skipped.
+        foundry = self._by_name.get("foundry")
+        if (
+            foundry is not None
+            and self.adapters[0] is foundry
+            and os.path.isfile(os.path.join(project_dir, "foundry.toml"))
+        ):
+            if mtime_ns is not None:
+                self._detect_cache[project_dir] = (mtime_ns, foundry)
+            return foundry
+        # Deterministic precedence: Foundry > Hardhat > Truffle (adapter order);
+        # stop at the first applicable adapter rather than probing the rest.
+        # The directory snapshot is shared by every adapter offering the fast
+        # membership check; others keep the per-file is_applicable probe.
+        snapshot = None
+        for adapter in self.adapters:
+            fast = getattr(adapter, "is_applicable_fast", None)
+            if fast is not None:
+                if snapshot is None:
+                    snapshot = self._snapshot_root(project_dir)
+                applicable = fast(*snapshot)
+            else:
+                applicable = adapter.is_applicable(project_dir)
+            if applicable:
+                if mtime_ns is not None:
+                    self._detect_cache[project_dir] = (mtime_ns, adapter)
+                return adapter
+        raise RuntimeError("No supported dev tool detected in project directory")
 
     def _exec(self, command: Sequence[str], project_dir: str, env: Optional[Mapping[str, str]]) -> CommandResult:
+        # Normalize once so CommandResult.command is always an immutable tuple
+        command = tuple(command)
         code, out, err = run_command(command, cwd=project_dir, env=env)
         return CommandResult(ok=(code == 0), code=code, stdout=out, stderr=err, command=command)
 
     def _get_adapter(self, project_dir: str, tool: Optional[str]) -> DevToolAdapter:
         if tool:
-            for adapter in self.adapters:
-                if adapter.name.lower() == tool.lower():
-                    return adapter
-            raise ValueError(f"Unknown tool '{tool}'. Supported: {[a.name for a in self.adapters]}")
+            adapter = self._by_name.get(tool.lower())
+            if adapter is None:
+                raise ValueError(f"Unknown tool '{tool}'. Supported: {[a.name for a in self.adapters]}")
+            return adapter
         return self.detect(project_dir)
 
+    async def _exec_async(self, command: Sequence[str], project_dir: str, env: Optional[Mapping[str, str]]) -> CommandResult:
+        command = tuple(command)
+        code, out, err = await run_command_async(command, cwd=project_dir, env=env)
+        return CommandResult(ok=(code == 0), code=code, stdout=out, stderr=err, command=command)
+
     def build(self, project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> CommandResult:
         adapter = self._get_adapter(project_dir, tool)
         return self._exec(adapter.build_command(project_dir), project_dir, env)
@@ -45,4 +100,12 @@ class DevToolsService:
         adapter = self._get_adapter(project_dir, tool)
         return self._exec(adapter.test_command(project_dir), project_dir, env)
 
+    async def build_async(self, project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> CommandResult:
+        adapter = self._get_adapter(project_dir, tool)
+        return await self._exec_async(adapter.build_command(project_dir), project_dir, env)
+
+    async def test_async(self, project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> CommandResult:
+        adapter = self._get_adapter(project_dir, tool)
+        return await self._exec_async(adapter.test_command(project_dir), project_dir, env)
+
 
@@ -0,0 +1,23 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _session_temp_root():
+    """Point tempfile at one session-wide root, on tmpfs when available.
+
+    The unittest-style classes here allocate their temp directories through
+    tempfile.mkdtemp; routing those to a single root under /dev/shm keeps the
+    stat-heavy fixture churn off the real disk and guarantees everything is
+    removed in one sweep at the end of the session.
+    """
+    base = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+    root = tempfile.mkdtemp(prefix="bevor-tests-", dir=base)
+    previous = tempfile.tempdir
+    tempfile.tempdir = root
+    yield
+    tempfile.tempdir = previous
+    shutil.rmtree(root, ignore_errors=True)
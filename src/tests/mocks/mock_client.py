@@ -1,7 +1,12 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 import asyncio
+import mmap
+import os
 from pathlib import Path
-import uuid
+import secrets
+
+from utils.async_loop import get_shared_loop
+from utils.solidity_etl import _iter_sol_files
 
 
 class MockBevorApiClient:
@@ -27,6 +32,10 @@ class MockBevorApiClient:
         self._versions: Dict[str, Dict[str, Any]] = {}
         self._chats: Dict[str, Dict[str, Any]] = {}
 
+        # Open mappings backing the memoryviews handed out by
+        # pull_in_solidity_test_folder; closed when the client goes away
+        self._mmaps: list = []
+
     async def create(self) -> "MockBevorApiClient":
         if not self.project_id:
             project_resp = await self._create_project()
@@ -34,7 +43,7 @@ class MockBevorApiClient:
             self.project_id = project_resp.get("id")
 
         if self.contracts_folder_path:
-            contracts_map = self.pull_in_solidity_test_folder(self.contracts_folder_path)
+            contracts_map = await self.pull_in_solidity_test_folder(self.contracts_folder_path)
             version_resp = self.versions_create_folder(contracts_map, self.project_id or "")
             self.last_version_response = version_resp
             self.version_mapping_id = version_resp.get("version_mapping_id")
@@ -46,31 +55,71 @@ class MockBevorApiClient:
         return self
 
     def create_sync(self) -> "MockBevorApiClient":
-        return asyncio.run(self.create())
+        return get_shared_loop().submit(self.create()).result()
 
     async def _create_project(self, project_name: Optional[str] = None) -> Dict[str, Any]:
-        name = project_name or f"MCP Chat | {uuid.uuid4()}"
-        pid = str(uuid.uuid4())
+        name = project_name or f"MCP Chat | {secrets.token_hex(16)}"
+        pid = secrets.token_hex(16)
         project = {"id": pid, "name": name, "description": "Mock project", "tags": ["mock"]}
         self._projects[pid] = project
         return project
 
-    def pull_in_solidity_test_folder(self, folder_path: str = "contracts") -> Dict[str, bytes]:
-        contracts_dict: Dict[str, bytes] = {}
+    # Cap on concurrent file reads; enough to overlap I/O latency without
+    # spawning a thread per contract on large repos
+    _READ_CONCURRENCY = 32
+
+    def _map_file(self, path: Path) -> Union[bytes, memoryview]:
+        """mmap a file read-only and return a memoryview over its pages.
+
+        Avoids copying each file into a Python bytes object; the kernel page
+        cache backs the view directly. Empty files cannot be mapped, so they
+        come back as b"".
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                return b""
+            mm = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        self._mmaps.append(mm)
+        return memoryview(mm)
+
+    async def pull_in_solidity_test_folder(self, folder_path: str = "contracts") -> Dict[str, Union[bytes, memoryview]]:
+        contracts_dict: Dict[str, Union[bytes, memoryview]] = {}
         folder = Path(folder_path)
-        if not folder.exists() or not folder.is_dir():
+        if not os.path.isdir(folder):
             return contracts_dict
-        for file_path in folder.rglob("*.sol"):
-            if file_path.is_file():
-                rel_path = str(file_path.relative_to(folder))
-                with open(file_path, 'rb') as f:
-                    contracts_dict[rel_path] = f.read()
+        entries = list(_iter_sol_files(folder))
+        if not entries:
+            return contracts_dict
+        sem = asyncio.Semaphore(self._READ_CONCURRENCY)
+
+        async def _read(path: Path) -> Union[bytes, memoryview]:
+            async with sem:
+                return await asyncio.to_thread(self._map_file, path)
+
+        contents = await asyncio.gather(*(_read(p) for _, p in entries))
+        for (rel_path, _), data in zip(entries, contents):
+            contracts_dict[rel_path] = data
         return contracts_dict
 
-    def versions_create_folder(self, file_map: Dict[str, bytes], project_id: str) -> Dict[str, Any]:
+    def __del__(self) -> None:
+        for mm in self._mmaps:
+            try:
+                mm.close()
+            except (BufferError, ValueError):
+                # A view over the mapping is still exported somewhere; the
+                # mapping is released when that view is garbage collected
+                pass
+
+    def versions_create_folder(self, file_map: Dict[str, Any], project_id: str) -> Dict[str, Any]:
+        # Values may be bytes or Path sources, mirroring the real client's
+        # streaming upload contract; the mock only records the file names.
         if not project_id:
             return {"error": "project_id required"}
-        vmid = str(uuid.uuid4())
+        vmid = secrets.token_hex(16)
         version = {
             "id": vmid,
             "version_mapping_id": vmid,
@@ -84,7 +133,7 @@ class MockBevorApiClient:
     def chat_with_version(self, version_mapping_id: str) -> Dict[str, Any]:
         if version_mapping_id not in self._versions:
             return {"error": "unknown version"}
-        cid = str(uuid.uuid4())
+        cid = secrets.token_hex(16)
         chat = {"id": cid, "version_mapping_id": version_mapping_id, "messages": []}
         self._chats[cid] = chat
         return chat
@@ -1,6 +1,7 @@
 import unittest
 import tempfile
 import os
+import shutil
 from pathlib import Path
 import asyncio
 import re
@@ -44,7 +45,6 @@ contract BevorToken is ERC20 {
 
     def tearDown(self):
         # Clean up temp directory
-        import shutil
         shutil.rmtree(self.temp_dir)
         # Nothing to clean up for mock/live selection
 
@@ -1,6 +1,7 @@
 import unittest
 import tempfile
 import os
+import shutil
 from pathlib import Path
 import asyncio
 from bevor_api.client import BevorApiClient
@@ -50,7 +51,6 @@ contract BevorToken is ERC20 {
 
     def tearDown(self):
         # Clean up temp directory
-        import shutil
         shutil.rmtree(self.temp_dir)
 
     async def _client_integration_async(self):
@@ -3,10 +3,12 @@
 import unittest
 import tempfile
 import os
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import shutil
+from unittest.mock import patch
 from typing import Sequence
 
+from pyfakefs import fake_filesystem_unittest
+
 from services.devtools.base import CommandResult, DevToolAdapter
 from services.devtools.service import DevToolsService
 from services.devtools.adapters import FoundryAdapter, HardhatAdapter, TruffleAdapter
@@ -50,21 +52,21 @@ class TestCommandResult(unittest.TestCase):
         self.assertEqual(list(result.command), ["test", "command"])
 
 
-class TestFoundryAdapter(unittest.TestCase):
+class TestFoundryAdapter(fake_filesystem_unittest.TestCase):
     """Test Foundry adapter detection and commands."""
-    
+
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        # Detection only asks whether files appear to exist, so an in-memory
+        # filesystem removes every real syscall from these tests
+        self.setUpPyfakefs()
+        self.temp_dir = "/project"
+        self.fs.create_dir(self.temp_dir)
         self.adapter = FoundryAdapter()
-    
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
+
     def test_foundry_detection_with_config(self):
         """Test detection when foundry.toml exists."""
-        config_file = Path(self.temp_dir) / "foundry.toml"
-        config_file.write_text("[profile.default]\n")
+        with open(os.path.join(self.temp_dir, "foundry.toml"), "w") as cfg:
+            cfg.write("[profile.default]\n")
         
         self.assertTrue(self.adapter.is_applicable(self.temp_dir))
     
@@ -86,36 +88,36 @@ class TestFoundryAdapter(unittest.TestCase):
         self.assertEqual(list(test_cmd), ["forge", "test"])
 
 
-class TestHardhatAdapter(unittest.TestCase):
+class TestHardhatAdapter(fake_filesystem_unittest.TestCase):
     """Test Hardhat adapter detection and commands."""
-    
+
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        # Detection only asks whether files appear to exist, so an in-memory
+        # filesystem removes every real syscall from these tests
+        self.setUpPyfakefs()
+        self.temp_dir = "/project"
+        self.fs.create_dir(self.temp_dir)
         self.adapter = HardhatAdapter()
-    
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
+
     def test_hardhat_detection_with_js_config(self):
         """Test detection with hardhat.config.js."""
-        config_file = Path(self.temp_dir) / "hardhat.config.js"
-        config_file.write_text("module.exports = {};")
+        with open(os.path.join(self.temp_dir, "hardhat.config.js"), "w") as cfg:
+            cfg.write("module.exports = {};")
         
         self.assertTrue(self.adapter.is_applicable(self.temp_dir))
     
     def test_hardhat_detection_with_ts_config(self):
         """Test detection with hardhat.config.ts."""
-        config_file = Path(self.temp_dir) / "hardhat.config.ts"
-        config_file.write_text("export default {};")
+        with open(os.path.join(self.temp_dir, "hardhat.config.ts"), "w") as cfg:
+            cfg.write("export default {};")
         
         self.assertTrue(self.adapter.is_applicable(self.temp_dir))
     
     def test_hardhat_detection_with_binary(self):
         """Test detection with node_modules binary."""
-        binary_path = Path(self.temp_dir) / "node_modules" / ".bin" / "hardhat"
-        binary_path.parent.mkdir(parents=True)
-        binary_path.touch()
+        bin_dir = os.path.join(self.temp_dir, "node_modules", ".bin")
+        os.makedirs(bin_dir)
+        open(os.path.join(bin_dir, "hardhat"), "w").close()
         
         self.assertTrue(self.adapter.is_applicable(self.temp_dir))
     
@@ -132,36 +134,36 @@ class TestHardhatAdapter(unittest.TestCase):
         self.assertEqual(list(test_cmd), ["npx", "hardhat", "test"])
 
 
-class TestTruffleAdapter(unittest.TestCase):
+class TestTruffleAdapter(fake_filesystem_unittest.TestCase):
     """Test Truffle adapter detection and commands."""
-    
+
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        # Detection only asks whether files appear to exist, so an in-memory
+        # filesystem removes every real syscall from these tests
+        self.setUpPyfakefs()
+        self.temp_dir = "/project"
+        self.fs.create_dir(self.temp_dir)
         self.adapter = TruffleAdapter()
-    
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
+
     def test_truffle_detection_with_config_js(self):
         """Test detection with truffle-config.js."""
-        config_file = Path(self.temp_dir) / "truffle-config.js"
-        config_file.write_text("module.exports = {};")
+        with open(os.path.join(self.temp_dir, "truffle-config.js"), "w") as cfg:
+            cfg.write("module.exports = {};")
         
         self.assertTrue(self.adapter.is_applicable(self.temp_dir))
     
     def test_truffle_detection_with_truffle_js(self):
         """Test detection with truffle.js."""
-        config_file = Path(self.temp_dir) / "truffle.js"
-        config_file.write_text("module.exports = {};")
+        with open(os.path.join(self.temp_dir, "truffle.js"), "w") as cfg:
+            cfg.write("module.exports = {};")
         
         self.assertTrue(self.adapter.is_applicable(self.temp_dir))
     
     def test_truffle_detection_with_binary(self):
         """Test detection with node_modules binary."""
-        binary_path = Path(self.temp_dir) / "node_modules" / ".bin" / "truffle"
-        binary_path.parent.mkdir(parents=True)
-        binary_path.touch()
+        bin_dir = os.path.join(self.temp_dir, "node_modules", ".bin")
+        os.makedirs(bin_dir)
+        open(os.path.join(bin_dir, "truffle"), "w").close()
         
         self.assertTrue(self.adapter.is_applicable(self.temp_dir))
     
@@ -180,15 +182,25 @@ class TestTruffleAdapter(unittest.TestCase):
 
 class TestDevToolsService(unittest.TestCase):
     """Test DevToolsService orchestration."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.tmp_root)
+        # The service is stateless apart from its detection cache, which is
+        # keyed by directory and safe to share across per-test subdirs
+        cls.service = DevToolsService()
+        # One patcher for every test that stubs command execution; applying
+        # the decorator per test repaid the module-attribute walk each time
+        cls._run_command_patcher = patch('services.devtools.service.run_command')
+        cls.mock_run_command = cls._run_command_patcher.start()
+        cls.addClassCleanup(cls._run_command_patcher.stop)
+
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.service = DevToolsService()
-    
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
+        self.temp_dir = os.path.join(self.tmp_root, self._testMethodName)
+        os.mkdir(self.temp_dir)
+        self.mock_run_command.reset_mock(return_value=True)
+
     def test_service_initialization_with_default_adapters(self):
         """Test service initializes with default adapters."""
         self.assertEqual(len(self.service.adapters), 3)
@@ -208,8 +220,8 @@ class TestDevToolsService(unittest.TestCase):
     def test_detection_with_applicable_adapter(self):
         """Test detection finds applicable adapter."""
         # Create foundry config
-        config_file = Path(self.temp_dir) / "foundry.toml"
-        config_file.write_text("[profile.default]\n")
+        with open(os.path.join(self.temp_dir, "foundry.toml"), "w") as cfg:
+            cfg.write("[profile.default]\n")
         
         adapter = self.service.detect(self.temp_dir)
         self.assertEqual(adapter.name, "foundry")
@@ -224,11 +236,11 @@ class TestDevToolsService(unittest.TestCase):
     def test_detection_precedence(self):
         """Test detection follows precedence order (Foundry > Hardhat > Truffle)."""
         # Create both foundry and hardhat configs
-        foundry_config = Path(self.temp_dir) / "foundry.toml"
-        foundry_config.write_text("[profile.default]\n")
+        with open(os.path.join(self.temp_dir, "foundry.toml"), "w") as cfg:
+            cfg.write("[profile.default]\n")
         
-        hardhat_config = Path(self.temp_dir) / "hardhat.config.js"
-        hardhat_config.write_text("module.exports = {};")
+        with open(os.path.join(self.temp_dir, "hardhat.config.js"), "w") as cfg:
+            cfg.write("module.exports = {};")
         
         adapter = self.service.detect(self.temp_dir)
         self.assertEqual(adapter.name, "foundry")
@@ -251,15 +263,14 @@ class TestDevToolsService(unittest.TestCase):
         self.assertIn("Unknown tool 'unknown'", str(context.exception))
         self.assertIn("Supported:", str(context.exception))
     
-    @patch('services.devtools.service.run_command')
-    def test_build_with_auto_detection(self, mock_run_command):
+    def test_build_with_auto_detection(self):
         """Test build command with auto-detection."""
         # Setup foundry config
-        config_file = Path(self.temp_dir) / "foundry.toml"
-        config_file.write_text("[profile.default]\n")
+        with open(os.path.join(self.temp_dir, "foundry.toml"), "w") as cfg:
+            cfg.write("[profile.default]\n")
         
         # Mock successful command execution
-        mock_run_command.return_value = (0, "Build successful", "")
+        self.mock_run_command.return_value = (0, "Build successful", "")
         
         result = self.service.build(self.temp_dir)
         
@@ -267,17 +278,16 @@ class TestDevToolsService(unittest.TestCase):
         self.assertEqual(result.code, 0)
         self.assertEqual(result.stdout, "Build successful")
         self.assertEqual(list(result.command), ["forge", "build"])
-        mock_run_command.assert_called_once_with(
-            ["forge", "build"],
+        self.mock_run_command.assert_called_once_with(
+            ("forge", "build"),
             cwd=self.temp_dir,
             env=None
         )
     
-    @patch('services.devtools.service.run_command')
-    def test_build_with_explicit_tool(self, mock_run_command):
+    def test_build_with_explicit_tool(self):
         """Test build command with explicit tool selection."""
         # Mock successful command execution
-        mock_run_command.return_value = (0, "Hardhat build successful", "")
+        self.mock_run_command.return_value = (0, "Hardhat build successful", "")
         
         result = self.service.build(self.temp_dir, tool="hardhat")
         
@@ -285,41 +295,39 @@ class TestDevToolsService(unittest.TestCase):
         self.assertEqual(result.code, 0)
         self.assertEqual(result.stdout, "Hardhat build successful")
         self.assertEqual(list(result.command), ["npx", "hardhat", "compile"])
-        mock_run_command.assert_called_once_with(
-            ["npx", "hardhat", "compile"],
+        self.mock_run_command.assert_called_once_with(
+            ("npx", "hardhat", "compile"),
             cwd=self.temp_dir,
             env=None
         )
     
-    @patch('services.devtools.service.run_command')
-    def test_build_with_custom_env(self, mock_run_command):
+    def test_build_with_custom_env(self):
         """Test build command with custom environment variables."""
         # Setup foundry config
-        config_file = Path(self.temp_dir) / "foundry.toml"
-        config_file.write_text("[profile.default]\n")
+        with open(os.path.join(self.temp_dir, "foundry.toml"), "w") as cfg:
+            cfg.write("[profile.default]\n")
         
         # Mock successful command execution
-        mock_run_command.return_value = (0, "Build successful", "")
+        self.mock_run_command.return_value = (0, "Build successful", "")
         
         custom_env = {"NODE_ENV": "test", "VERBOSE": "1"}
         result = self.service.build(self.temp_dir, env=custom_env)
         
         self.assertTrue(result.ok)
-        mock_run_command.assert_called_once_with(
-            ["forge", "build"],
+        self.mock_run_command.assert_called_once_with(
+            ("forge", "build"),
             cwd=self.temp_dir,
             env=custom_env
         )
     
-    @patch('services.devtools.service.run_command')
-    def test_build_with_failure(self, mock_run_command):
+    def test_build_with_failure(self):
         """Test build command with failure."""
         # Setup foundry config
-        config_file = Path(self.temp_dir) / "foundry.toml"
-        config_file.write_text("[profile.default]\n")
+        with open(os.path.join(self.temp_dir, "foundry.toml"), "w") as cfg:
+            cfg.write("[profile.default]\n")
         
         # Mock failed command execution
-        mock_run_command.return_value = (1, "", "Compilation failed")
+        self.mock_run_command.return_value = (1, "", "Compilation failed")
         
         result = self.service.build(self.temp_dir)
         
@@ -328,15 +336,14 @@ class TestDevToolsService(unittest.TestCase):
         self.assertEqual(result.stderr, "Compilation failed")
         self.assertEqual(list(result.command), ["forge", "build"])
     
-    @patch('services.devtools.service.run_command')
-    def test_test_with_auto_detection(self, mock_run_command):
+    def test_test_with_auto_detection(self):
         """Test test command with auto-detection."""
         # Setup hardhat config
-        config_file = Path(self.temp_dir) / "hardhat.config.js"
-        config_file.write_text("module.exports = {};")
+        with open(os.path.join(self.temp_dir, "hardhat.config.js"), "w") as cfg:
+            cfg.write("module.exports = {};")
         
         # Mock successful command execution
-        mock_run_command.return_value = (0, "All tests passed", "")
+        self.mock_run_command.return_value = (0, "All tests passed", "")
         
         result = self.service.test(self.temp_dir)
         
@@ -344,17 +351,16 @@ class TestDevToolsService(unittest.TestCase):
         self.assertEqual(result.code, 0)
         self.assertEqual(result.stdout, "All tests passed")
         self.assertEqual(list(result.command), ["npx", "hardhat", "test"])
-        mock_run_command.assert_called_once_with(
-            ["npx", "hardhat", "test"],
+        self.mock_run_command.assert_called_once_with(
+            ("npx", "hardhat", "test"),
             cwd=self.temp_dir,
             env=None
         )
     
-    @patch('services.devtools.service.run_command')
-    def test_test_with_explicit_tool(self, mock_run_command):
+    def test_test_with_explicit_tool(self):
         """Test test command with explicit tool selection."""
         # Mock successful command execution
-        mock_run_command.return_value = (0, "Truffle tests passed", "")
+        self.mock_run_command.return_value = (0, "Truffle tests passed", "")
         
         result = self.service.test(self.temp_dir, tool="truffle")
         
@@ -362,8 +368,8 @@ class TestDevToolsService(unittest.TestCase):
         self.assertEqual(result.code, 0)
         self.assertEqual(result.stdout, "Truffle tests passed")
         self.assertEqual(list(result.command), ["npx", "truffle", "test"])
-        mock_run_command.assert_called_once_with(
-            ["npx", "truffle", "test"],
+        self.mock_run_command.assert_called_once_with(
+            ("npx", "truffle", "test"),
             cwd=self.temp_dir,
             env=None
         )
@@ -371,14 +377,16 @@ class TestDevToolsService(unittest.TestCase):
 
 class TestRunCommand(unittest.TestCase):
     """Test command runner functionality."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.tmp_root)
+
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
+        self.temp_dir = os.path.join(self.tmp_root, self._testMethodName)
+        os.mkdir(self.temp_dir)
+
     def test_run_command_success(self):
         """Test successful command execution."""
         # Use a simple command that should work on all platforms
@@ -435,32 +443,34 @@ class TestRunCommand(unittest.TestCase):
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete devtools service."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.tmp_root)
+        cls.service = DevToolsService()
+
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.service = DevToolsService()
-    
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
+        self.temp_dir = os.path.join(self.tmp_root, self._testMethodName)
+        os.mkdir(self.temp_dir)
+
     def test_full_workflow_foundry(self):
         """Test complete workflow with Foundry project."""
         # Create foundry project structure
-        config_file = Path(self.temp_dir) / "foundry.toml"
-        config_file.write_text("""
+        with open(os.path.join(self.temp_dir, "foundry.toml"), "w") as cfg:
+            cfg.write("""
 [profile.default]
 src = "src"
 out = "out"
 libs = ["lib"]
 """)
         
-        src_dir = Path(self.temp_dir) / "src"
-        src_dir.mkdir()
+        src_dir = os.path.join(self.temp_dir, "src")
+        os.mkdir(src_dir)
         
         # Create a simple contract
-        contract_file = src_dir / "Test.sol"
-        contract_file.write_text("""
+        with open(os.path.join(src_dir, "Test.sol"), "w") as contract:
+            contract.write("""
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.0;
 
@@ -486,8 +496,8 @@ contract Test {
     def test_full_workflow_hardhat(self):
         """Test complete workflow with Hardhat project."""
         # Create hardhat project structure
-        config_file = Path(self.temp_dir) / "hardhat.config.js"
-        config_file.write_text("""
+        with open(os.path.join(self.temp_dir, "hardhat.config.js"), "w") as cfg:
+            cfg.write("""
 module.exports = {
   solidity: "0.8.0",
   paths: {
@@ -499,12 +509,12 @@ module.exports = {
 };
 """)
         
-        contracts_dir = Path(self.temp_dir) / "contracts"
-        contracts_dir.mkdir()
+        contracts_dir = os.path.join(self.temp_dir, "contracts")
+        os.mkdir(contracts_dir)
         
         # Create a simple contract
-        contract_file = contracts_dir / "Test.sol"
-        contract_file.write_text("""
+        with open(os.path.join(contracts_dir, "Test.sol"), "w") as contract:
+            contract.write("""
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.0;
 
@@ -1,18 +1,20 @@
 import unittest
 import tempfile
-import os
 from pathlib import Path
 import shutil
 from utils.solidity_etl import find_contracts_folder_in_directory
 
 class TestFindContractsFolder(unittest.TestCase):
-    def setUp(self):
-        # Create a temporary directory for each test
-        self.test_dir = Path(tempfile.mkdtemp())
+    @classmethod
+    def setUpClass(cls):
+        # One temp root for the class, removed once; each test works in its
+        # own subdirectory instead of paying mkdtemp+rmtree per method
+        cls.tmp_root = Path(tempfile.mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, cls.tmp_root)
 
-    def tearDown(self):
-        # Clean up temporary directory after each test
-        shutil.rmtree(self.test_dir)
+    def setUp(self):
+        self.test_dir = self.tmp_root / self._testMethodName
+        self.test_dir.mkdir()
 
     def test_contracts_folder_at_root(self):
         # Create contracts folder with .sol file at root
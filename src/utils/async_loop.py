@@ -0,0 +1,78 @@
+"""Shared event-loop thread for sync wrappers around async code.
+
+asyncio.run builds and tears down a fresh event loop (and its executor) on
+every call. Sync entry points like ``create_sync`` instead submit their
+coroutines to one long-lived loop running on a daemon thread, so repeated
+calls reuse the loop and fire-and-forget work can keep running between them.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+
+class AsyncLoopThread:
+    """A dedicated event loop running on a background thread.
+
+    ``submit`` is thread-safe and returns a concurrent.futures.Future, so
+    synchronous callers can block with ``.result()`` while async callers on
+    other loops remain unaffected.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="bevor-async-loop", daemon=True
+                    )
+                    self._thread.start()
+        # Every caller waits for the loop to be ready, not just the one that
+        # created the thread; otherwise a concurrent submit() could race the
+        # loop-thread startup and see self._loop as None
+        self._started.wait()
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._started.set()
+        self._loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """Schedule a coroutine on the loop and return its Future."""
+        self.start()
+        assert self._loop is not None
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._started.clear()
+
+
+# Process-wide loop shared by all sync wrappers; started lazily on first use
+_shared_loop: Optional[AsyncLoopThread] = None
+_shared_loop_lock = threading.Lock()
+
+
+def get_shared_loop() -> AsyncLoopThread:
+    """Return the process-wide AsyncLoopThread, creating it on first use."""
+    global _shared_loop
+    if _shared_loop is None:
+        with _shared_loop_lock:
+            if _shared_loop is None:
+                _shared_loop = AsyncLoopThread()
+    return _shared_loop
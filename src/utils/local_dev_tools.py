@@ -1,13 +1,21 @@
+from functools import lru_cache
 from typing import Optional, Mapping
 
-from services.devtools import DevToolsService
 
+@lru_cache(maxsize=1)
+def _get_service():
+    """Construct the shared DevToolsService on first use.
 
-_service = DevToolsService()
+    The import happens here so that importing this module doesn't pull in the
+    service and its adapters for callers that never invoke build/test.
+    """
+    from services.devtools import DevToolsService
 
+    return DevToolsService()
 
-def build(project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> dict:
-    res = _service.build(project_dir=project_dir, tool=tool, env=env)
+
+def _shape(res, project_dir: str, tool: Optional[str]) -> dict:
+    """Shape a CommandResult for JSON callers."""
     return {
         "ok": res.ok,
         "code": res.code,
@@ -19,16 +27,28 @@ def build(project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[st
     }
 
 
+def _invoke(op: str, project_dir: str, tool: Optional[str], env: Optional[Mapping[str, str]]) -> dict:
+    res = getattr(_get_service(), op)(project_dir=project_dir, tool=tool, env=env)
+    return _shape(res, project_dir, tool)
+
+
+def build(project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> dict:
+    return _invoke("build", project_dir, tool, env)
+
+
 def test(project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> dict:
-    res = _service.test(project_dir=project_dir, tool=tool, env=env)
-    return {
-        "ok": res.ok,
-        "code": res.code,
-        "stdout": res.stdout,
-        "stderr": res.stderr,
-        "command": list(res.command),
-        "project_dir": project_dir,
-        "tool": tool or "auto",
-    }
+    return _invoke("test", project_dir, tool, env)
+
+
+async def build_async(project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> dict:
+    """Async build wrapper; independent invocations can run concurrently."""
+    res = await _get_service().build_async(project_dir=project_dir, tool=tool, env=env)
+    return _shape(res, project_dir, tool)
+
+
+async def test_async(project_dir: str, tool: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> dict:
+    """Async test wrapper; independent invocations can run concurrently."""
+    res = await _get_service().test_async(project_dir=project_dir, tool=tool, env=env)
+    return _shape(res, project_dir, tool)
 
 
@@ -1,43 +1,120 @@
 import os
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
+
+# Folder names that identify a contracts directory outright
+_PRIORITY_NAMES = frozenset({'contracts', 'src', 'source', 'solidity'})
+
+# Common non-contract directories to skip while *detecting* the contracts
+# folder; hidden directories (.git, .venv, .foundry, ...) are pruned by name
+# prefix. Not applied to uploads — see _UPLOAD_IGNORED_DIRS.
+_IGNORED_DIRS = frozenset({'node_modules', 'build', 'test', 'out', 'cache',
+                           'artifacts', 'dist', 'coverage'})
+
+# Upload walks only skip genuinely vendored trees: once a contracts folder has
+# been chosen, everything under it belongs to the audit (Foundry keeps tests
+# in test/, for instance), so the detection prune set must not apply here
+_UPLOAD_IGNORED_DIRS = frozenset({'.git', 'node_modules'})
+
+
+def _iter_sol_files(root: Path) -> Iterator[Tuple[str, Path]]:
+    """Yield (relative_path, absolute_path) for every .sol file under root.
+
+    A single scandir-based walk shared by the API clients: directory checks
+    use the cached readdir d_type, so no per-entry stat is issued. Only
+    vendored directories are skipped; anything else under the chosen folder,
+    including test/ sources, is included in the upload.
+    """
+    stack = [(os.fspath(root), "")]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _UPLOAD_IGNORED_DIRS:
+                            stack.append((entry.path, prefix + entry.name + "/"))
+                    elif entry.name.endswith('.sol') and entry.is_file(follow_symlinks=False):
+                        yield prefix + entry.name, Path(entry.path)
+        except OSError:
+            continue
+
+
+# Walk results keyed by root path; the stored mtime_ns invalidates an entry
+# when the root directory's contents change
+_CONTRACTS_CACHE: dict = {}
+
 
 def find_contracts_folder_in_directory(directory: Path) -> Optional[Path]:
     """
     Find the primary folder containing Solidity (.sol) files in the given directory.
-    
+
     This function searches for folders that contain .sol files, prioritizing common
     naming patterns like 'contracts', 'src', 'source', etc. but will ultimately
     return any folder that contains Solidity files.
-    
+
+    Results are memoized per root directory, invalidated by its mtime, so
+    repeat lookups on an unchanged project skip the walk entirely. Use
+    ``find_contracts_folder_in_directory.cache_clear()`` to reset.
+
     Args:
         directory: Root directory to search in
-        
+
     Returns:
         Path to the folder containing .sol files, or None if no such folder is found
     """
-    # Common folder names for Solidity contracts
-    priority_names = {'contracts', 'src', 'source', 'solidity'}
-    
+    key = os.fspath(directory)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None:
+        cached = _CONTRACTS_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+    result = _scan_contracts_folder(directory)
+    if mtime_ns is not None:
+        _CONTRACTS_CACHE[key] = (mtime_ns, result)
+    return result
+
+
+find_contracts_folder_in_directory.cache_clear = _CONTRACTS_CACHE.clear
+
+
+def _scan_contracts_folder(directory: Path) -> Optional[Path]:
+    """Uncached walk behind find_contracts_folder_in_directory.
+
+    Iterative breadth-first scandir traversal: no recursion frames, and the
+    shallowest priority-named folder with Solidity sources wins before deeper
+    levels are read at all.
+    """
     # Track folders with .sol files and their file counts
     sol_folders = {}
-    
-    for root, dirs, files in os.walk(directory):
-        # Count .sol files in current directory
-        sol_count = sum(1 for f in files if f.lower().endswith('.sol'))
+    queue = deque([(os.fspath(directory), directory.name)])
+    while queue:
+        path, name = queue.popleft()
+        sol_count = 0
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # DirEntry type checks use the cached readdir d_type, so
+                    # this avoids the per-file stat that os.walk incurs
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _IGNORED_DIRS and not entry.name.startswith('.'):
+                            queue.append((entry.path, entry.name))
+                    elif entry.name.endswith('.sol') and entry.is_file(follow_symlinks=False):
+                        sol_count += 1
+        except OSError:
+            continue
         if sol_count > 0:
-            sol_folders[Path(root)] = sol_count
-            
-        # Skip common non-contract directories
-        dirs[:] = [d for d in dirs if d not in {'.git', 'node_modules', 'build', 'test'}]
-    
+            # A priority-named folder with Solidity sources wins outright
+            if name.lower() in _PRIORITY_NAMES:
+                return Path(path)
+            sol_folders[Path(path)] = sol_count
+
     if not sol_folders:
         return None
-        
-    # First try to find a priority named folder with .sol files
-    for folder in sol_folders:
-        if folder.name.lower() in priority_names:
-            return folder
-            
+
     # Otherwise return the folder with the most .sol files
     return max(sol_folders.items(), key=lambda x: x[1])[0]
\ No newline at end of file